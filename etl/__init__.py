@@ -3,14 +3,30 @@ ETL Pipeline Package
 Extracts, transforms, and loads .pol file data to Meta_data folder.
 """
 
-from .extract import extract_all_pol_files, get_changed_pol_files
-from .transform import transform_pol_data
-from .load import save_to_metadata_folder, save_summary_report
+import importlib
+
+from .extract import PolFileMeta, extract_all_pol_files, get_changed_pol_files
+
+# transform pulls in pandas/numpy, so transform and load are imported on first use
+_LAZY_EXPORTS = {
+    'transform_pol_data': 'transform',
+    'save_to_metadata_folder': 'load',
+    'save_summary_report': 'load',
+}
 
 __all__ = [
+    'PolFileMeta',
     'extract_all_pol_files',
     'get_changed_pol_files', 
     'transform_pol_data',
     'save_to_metadata_folder',
     'save_summary_report',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', __name__)
+    return getattr(module, name)
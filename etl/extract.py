@@ -3,10 +3,17 @@ Extract Module
 Handles discovery and reading of .pol files from the repository.
 """
 
+import os
+import re
+import json
+import codecs
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Optional, Iterator, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -22,20 +29,60 @@ EXCLUDED_DIRS = {
     'etl'
 }
 
+# Matches any excluded directory component in a posix relative path
+_EXCLUDED_RE = re.compile(
+    r'(?:^|/)(?:' + '|'.join(re.escape(d) for d in sorted(EXCLUDED_DIRS)) + r')(?:/|$)'
+)
 
+# Sidecar file (under Meta_data) caching the changed files per commit range
+DIFF_CACHE_FILENAME = '_diff_cache.json'
 
-def find_all_pol_files(repo_root: Path) -> List[Path]:
+# Thread count for reading files; reads are I/O-bound and release the GIL
+MAX_EXTRACT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def _scan_pol_files(directory: str) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
+    """
+    Walk a directory tree with os.scandir, yielding .pol files.
+    
+    Excluded directories are pruned by name before descending, so large
+    trees like .git or node_modules are never listed.
+    
+    Args:
+        directory: Directory to walk
+        
+    Yields:
+        (Path, stat result) tuples for each .pol file found; the stat result
+        is None for symlinks and files that could not be stat'ed, which are
+        stat'ed again (and any error reported) during extraction
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in EXCLUDED_DIRS:
+                    continue
+                yield from _scan_pol_files(entry.path)
+            elif entry.name.endswith('.pol'):
+                try:
+                    stat = None if entry.is_symlink() else entry.stat(follow_symlinks=False)
+                except OSError:
+                    stat = None
+                yield Path(entry.path), stat
+
+
+def find_all_pol_files(repo_root: Path) -> List[Tuple[Path, Optional[os.stat_result]]]:
     """
     Recursively find all .pol files in the samples/pools2 directory.
     
+    The stat result captured during the scan is returned alongside each
+    path so metadata extraction does not need to stat the file again.
+    
     Args:
         repo_root: Path to the repository root
         
     Returns:
-        List of Path objects for each .pol file found
+        List of (Path, stat result or None) tuples for each .pol file found
     """
-    pol_files = []
-    
     # Target specific directory as requested
     target_dir = repo_root / 'samples' / 'pools2'
     
@@ -43,41 +90,144 @@ def find_all_pol_files(repo_root: Path) -> List[Path]:
         logger.warning(f"Directory {target_dir} not found. Returning empty list.")
         return []
     
-    for path in target_dir.rglob('*.pol'):
-        # Skip excluded directories
-        if any(excluded in path.parts for excluded in EXCLUDED_DIRS):
-            continue
-        pol_files.append(path)
-    
-    return sorted(pol_files)
+    return sorted(_scan_pol_files(str(target_dir)), key=lambda item: item[0])
 
 
-def get_changed_files_from_git(repo_root: Path) -> List[str]:
+def _resolve_commit_range(repo_root: Path) -> Optional[Tuple[str, str]]:
     """
-    Get list of changed files from the last commit using git.
+    Resolve the HEAD~1 and HEAD commit SHAs.
     
     Args:
         repo_root: Path to the repository root
         
     Returns:
-        List of relative file paths that changed
+        (base_sha, head_sha) tuple, or None if they cannot be resolved
     """
     try:
         result = subprocess.run(
-            ['git', 'diff', '--name-only', 'HEAD~1', 'HEAD'],
+            ['git', 'rev-parse', 'HEAD~1', 'HEAD'],
             cwd=repo_root,
             capture_output=True,
             text=True,
             check=True
         )
-        changed = [f.strip() for f in result.stdout.strip().split('\n') if f.strip()]
-        return changed
+        shas = result.stdout.split()
+        if len(shas) != 2:
+            return None
+        return shas[0], shas[1]
+    except Exception as e:
+        logger.warning(f"Could not resolve commit range: {e}")
+        return None
+
+
+def _load_diff_cache(cache_file: Path, commit_range: str) -> Optional[List[str]]:
+    """
+    Load cached changed files for a commit range.
+    
+    Args:
+        cache_file: Path to the diff cache file
+        commit_range: "<base_sha>..<head_sha>" key
+        
+    Returns:
+        Cached list of changed files, or None on a miss
+    """
+    if not cache_file.exists():
+        return None
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read diff cache {cache_file}: {e}")
+        return None
+    
+    if not isinstance(cache, dict) or cache.get('range') != commit_range:
+        return None
+    
+    files = cache.get('files')
+    if not isinstance(files, list) or not all(isinstance(f, str) for f in files):
+        logger.warning(f"Ignoring malformed diff cache {cache_file}")
+        return None
+    
+    return files
+
+
+def _save_diff_cache(cache_file: Path, commit_range: str, changed: List[str]) -> None:
+    """
+    Save changed files for a commit range, replacing any previous entry.
+    
+    Args:
+        cache_file: Path to the diff cache file
+        commit_range: "<base_sha>..<head_sha>" key
+        changed: List of changed files
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'range': commit_range, 'files': changed}, f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning(f"Could not write diff cache {cache_file}: {e}")
+
+
+def get_changed_files_from_git(repo_root: Path, pathspecs: Optional[List[str]] = None) -> Optional[List[str]]:
+    """
+    Get list of files added or modified in the last commit using git.
+    
+    Deleted files are excluded by git itself (--diff-filter=AM), and
+    pathspecs let git filter paths before they reach Python.
+    
+    Results are cached in Meta_data/_diff_cache.json keyed on the
+    HEAD~1..HEAD commit SHAs, so re-running on the same commit skips
+    the diff entirely.
+    
+    Args:
+        repo_root: Path to the repository root
+        pathspecs: Optional git pathspecs to restrict the diff to
+        
+    Returns:
+        List of relative file paths that were added or modified, or None
+        if git could not determine the changes
+    """
+    shas = _resolve_commit_range(repo_root)
+    if shas is None:
+        return None
+    
+    base_sha, head_sha = shas
+    pathspecs = pathspecs or []
+    commit_range = f"{base_sha}..{head_sha}"
+    if pathspecs:
+        commit_range += ' -- ' + ' '.join(pathspecs)
+    cache_file = repo_root / 'Meta_data' / DIFF_CACHE_FILENAME
+    
+    cached = _load_diff_cache(cache_file, commit_range)
+    if cached is not None:
+        logger.info(f"Using cached diff for {commit_range}")
+        return cached
+    
+    try:
+        # -z gives NUL-delimited, unquoted paths so any filename parses safely
+        result = subprocess.run(
+            [
+                'git', 'diff-tree', '--no-commit-id', '--name-only', '-r', '-z',
+                '--diff-filter=AM', base_sha, head_sha, '--', *pathspecs
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            check=True
+        )
+        changed = [
+            f.decode('utf-8', errors='replace')
+            for f in result.stdout.split(b'\x00') if f
+        ]
     except subprocess.CalledProcessError as e:
         logger.warning(f"Could not get git diff: {e}")
-        return []
+        return None
     except Exception as e:
         logger.warning(f"Error getting changed files: {e}")
-        return []
+        return None
+    
+    _save_diff_cache(cache_file, commit_range, changed)
+    return changed
 
 
 def read_pol_file(file_path: Path) -> str:
@@ -90,48 +240,153 @@ def read_pol_file(file_path: Path) -> str:
     Returns:
         String contents of the file
     """
-    # Try different encodings
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
+    # Read once and decode in memory instead of reopening per encoding
+    data = file_path.read_bytes()
     
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
+    if data.startswith(codecs.BOM_UTF8):
+        return data[len(codecs.BOM_UTF8):].decode('utf-8', errors='replace')
     
-    # If all text encodings fail, read as binary and decode with errors='replace'
-    with open(file_path, 'rb') as f:
-        return f.read().decode('utf-8', errors='replace')
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so this never fails
+        return data.decode('latin-1')
+
 
+@dataclass(slots=True)
+class PolFileMeta:
+    """Metadata and content of an extracted .pol file."""
+    file_name: str
+    file_stem: str  # filename without extension
+    extension: str
+    relative_path: str
+    parent_folder: str
+    folder_path: str
+    absolute_path: str
+    size_bytes: int
+    modified_timestamp: float
+    content: str = ''
+    line_count: int = 0
 
-def extract_file_metadata(file_path: Path, repo_root: Path) -> Dict[str, Any]:
+
+def extract_file_metadata(
+    file_path: Path,
+    repo_root: Path,
+    stat: Optional[os.stat_result] = None
+) -> PolFileMeta:
     """
     Extract metadata about a file.
     
     Args:
         file_path: Path to the file
         repo_root: Path to the repository root
+        stat: Optional pre-fetched stat result; the file is stat'ed if omitted
         
     Returns:
-        Dictionary with file metadata
+        PolFileMeta with file metadata (content not yet read)
+    """
+    if stat is None:
+        stat = file_path.stat()
+    
+    # Plain string operations avoid building intermediate Path objects per file
+    absolute_path = str(file_path)
+    root = str(repo_root)
+    if absolute_path.startswith(root + os.sep):
+        relative_path = absolute_path[len(root) + 1:]
+    else:
+        relative_path = os.path.relpath(absolute_path, root)
+    
+    folder_path, file_name = os.path.split(relative_path)
+    file_stem, extension = os.path.splitext(file_name)
+    
+    return PolFileMeta(
+        file_name=file_name,
+        file_stem=file_stem,
+        extension=extension,
+        relative_path=relative_path,
+        parent_folder=os.path.basename(os.path.dirname(absolute_path)),
+        folder_path=folder_path or '.',
+        absolute_path=absolute_path,
+        size_bytes=stat.st_size,
+        modified_timestamp=stat.st_mtime,
+    )
+
+
+def _extract_one(
+    file_path: Path,
+    repo_root: Path,
+    stat: Optional[os.stat_result] = None
+) -> PolFileMeta:
     """
-    stat = file_path.stat()
+    Read a single .pol file along with its metadata.
     
-    return {
-        'file_name': file_path.name,
-        'file_stem': file_path.stem,  # filename without extension
-        'extension': file_path.suffix,
-        'relative_path': str(file_path.relative_to(repo_root)),
-        'parent_folder': file_path.parent.name,
-        'folder_path': str(file_path.parent.relative_to(repo_root)),
-        'absolute_path': str(file_path),
-        'size_bytes': stat.st_size,
-        'modified_timestamp': stat.st_mtime,
-    }
+    Args:
+        file_path: Path to the .pol file
+        repo_root: Path to the repository root
+        stat: Optional pre-fetched stat result for the file
+        
+    Returns:
+        PolFileMeta containing file metadata and content
+    """
+    file_data = extract_file_metadata(file_path, repo_root, stat)
+    file_data.content = read_pol_file(file_path)
+    content = file_data.content
+    # Count newlines in C rather than building a list of lines
+    file_data.line_count = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+    return file_data
 
 
-def extract_all_pol_files(repo_root: Path) -> List[Dict[str, Any]]:
+def _safe_extract(
+    file_path: Path,
+    repo_root: Path,
+    stat: Optional[os.stat_result] = None
+) -> Optional[PolFileMeta]:
+    """
+    Run _extract_one, logging and swallowing any error.
+    
+    Args:
+        file_path: Path to the .pol file
+        repo_root: Path to the repository root
+        stat: Optional pre-fetched stat result for the file
+        
+    Returns:
+        PolFileMeta for the file, or None if it could not be read
+    """
+    try:
+        return _extract_one(file_path, repo_root, stat)
+    except Exception as e:
+        logger.error(f"Error extracting {file_path}: {e}")
+        return None
+
+
+def _extract_files(
+    pol_files: List[Tuple[Path, Optional[os.stat_result]]],
+    repo_root: Path
+) -> List[PolFileMeta]:
+    """
+    Read many .pol files concurrently using a thread pool.
+    
+    Results are returned in the same order as pol_files; files that fail
+    to read are logged and left out.
+    
+    Args:
+        pol_files: (Path, stat result or None) tuples of the .pol files to read
+        repo_root: Path to the repository root
+        
+    Returns:
+        List of PolFileMeta containing file data
+    """
+    if not pol_files:
+        return []
+    
+    paths, stats = zip(*pol_files)
+    
+    with ThreadPoolExecutor(max_workers=MAX_EXTRACT_WORKERS) as executor:
+        results = executor.map(_safe_extract, paths, repeat(repo_root), stats)
+        return [file_data for file_data in results if file_data is not None]
+
+
+def extract_all_pol_files(repo_root: Path) -> List[PolFileMeta]:
     """
     Extract all .pol files with their content and metadata.
     
@@ -139,26 +394,15 @@ def extract_all_pol_files(repo_root: Path) -> List[Dict[str, Any]]:
         repo_root: Path to the repository root
         
     Returns:
-        List of dictionaries containing file data
+        List of PolFileMeta containing file data
     """
     pol_files = find_all_pol_files(repo_root)
     logger.info(f"Found {len(pol_files)} .pol files in repository")
     
-    extracted_data = []
-    
-    for file_path in pol_files:
-        try:
-            file_data = extract_file_metadata(file_path, repo_root)
-            file_data['content'] = read_pol_file(file_path)
-            file_data['line_count'] = len(file_data['content'].splitlines())
-            extracted_data.append(file_data)
-        except Exception as e:
-            logger.error(f"Error extracting {file_path}: {e}")
-    
-    return extracted_data
+    return _extract_files(pol_files, repo_root)
 
 
-def get_changed_pol_files(repo_root: Path) -> List[Dict[str, Any]]:
+def get_changed_pol_files(repo_root: Path) -> Optional[List[PolFileMeta]]:
     """
     Extract only .pol files that changed in the last commit.
     
@@ -166,18 +410,22 @@ def get_changed_pol_files(repo_root: Path) -> List[Dict[str, Any]]:
         repo_root: Path to the repository root
         
     Returns:
-        List of dictionaries containing file data for changed files
+        List of PolFileMeta for changed files (empty if nothing changed),
+        or None if the changes could not be determined from git
     """
-    changed_files = get_changed_files_from_git(repo_root)
+    changed_files = get_changed_files_from_git(repo_root, ['*.pol'])
+    
+    if changed_files is None:
+        return None
     
     if not changed_files:
-        logger.info("No changed files detected from git")
+        logger.info("No changed .pol files detected from git")
         return []
     
-    # Filter for .pol files in samples/pools2 only
+    # Filter for samples/pools2 only; git already limited this to added or modified .pol files
     changed_pol_files = [
         f for f in changed_files 
-        if f.endswith('.pol') and 'samples/pools2' in f.replace('\\', '/')
+        if 'samples/pools2' in f
     ]
     
     if not changed_pol_files:
@@ -186,26 +434,13 @@ def get_changed_pol_files(repo_root: Path) -> List[Dict[str, Any]]:
     
     logger.info(f"Found {len(changed_pol_files)} changed .pol files")
     
-    extracted_data = []
+    pol_files = []
     
     for relative_path in changed_pol_files:
-        file_path = repo_root / relative_path
-        
-        # Skip if file was deleted
-        if not file_path.exists():
-            logger.info(f"Skipping deleted file: {relative_path}")
-            continue
-        
         # Skip excluded directories
-        if any(excluded in file_path.parts for excluded in EXCLUDED_DIRS):
+        if _EXCLUDED_RE.search(relative_path):
             continue
         
-        try:
-            file_data = extract_file_metadata(file_path, repo_root)
-            file_data['content'] = read_pol_file(file_path)
-            file_data['line_count'] = len(file_data['content'].splitlines())
-            extracted_data.append(file_data)
-        except Exception as e:
-            logger.error(f"Error extracting {file_path}: {e}")
-    
-    return extracted_data
+        pol_files.append((repo_root / relative_path, None))
+    
+    return _extract_files(pol_files, repo_root)
@@ -3,83 +3,285 @@ Load Module
 Handles saving transformed data to the Meta_data folder in the repository.
 """
 
+import os
 import json
+import time
+import hashlib
 import logging
 from pathlib import Path
-from typing import Dict, Any, List
-from datetime import datetime
+from typing import Dict, Any, List, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for text output; coalesces the encoder's many small writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Per-folder shard file holding the transformed entries of that folder
+POOL_DATA_FILENAME = 'pool_data.json'
+
+# Single file holding every transformed entry in 'consolidated' mode
+CONSOLIDATED_FILENAME = 'all_pools_data.json'
+
+# 'sharded' writes one file per source folder, 'consolidated' a single file
+OUTPUT_MODES = ('sharded', 'consolidated')
+
+# Published layout: Meta_data/all_pools_data.json, which CI commits and consumers read
+DEFAULT_OUTPUT_MODE = 'consolidated'
+
+# Key under which each saved entry stores its content hash
+HASH_KEY = '_hash'
+
+# Index of all processed files, kept at the top of Meta_data
+INDEX_FILENAME = '_index.json'
+
+# Fields of each index record; records missing any of them are rebuilt
+INDEX_FIELDS = ('output_file', 'source_file', 'folder_path', 'processed_at', 'size')
+
+
+def _write_json(data: Any, path: Path) -> None:
+    """
+    Serialize data as indented UTF-8 JSON and write it to path.
+    
+    Uses orjson when available, falling back to the stdlib encoder.
+    
+    Args:
+        data: JSON-serializable data (unknown types are stringified)
+        path: Destination file path
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Read and parse a UTF-8 JSON file.
+    
+    Args:
+        path: JSON file path
+        
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _entry_key(transformed_data: Dict[str, Any]) -> str:
+    """
+    Get the unique key for a transformed entry (its posix source path).
+    
+    Args:
+        transformed_data: Transformed data dictionary
+        
+    Returns:
+        Normalized source_file path, or an empty string if missing
+    """
+    relative_path = transformed_data.get('metadata', {}).get('source_file')
+    if not relative_path:
+        return ''
+    # Normalize path separators to look cleaner in JSON
+    return str(Path(relative_path).as_posix())
+
+
+def _check_mode(mode: str) -> None:
+    """
+    Validate an output mode.
+    
+    Args:
+        mode: Output mode name
+        
+    Raises:
+        ValueError: If mode is not one of OUTPUT_MODES
+    """
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode {mode!r}, expected one of {OUTPUT_MODES}")
+
+
+def _output_filename(mode: str) -> str:
+    """
+    Get the name of the data files written in the given output mode.
+    
+    Args:
+        mode: Output mode name
+        
+    Returns:
+        Data file name
+    """
+    return CONSOLIDATED_FILENAME if mode == 'consolidated' else POOL_DATA_FILENAME
+
+
+def _output_file(key: str, mode: str) -> Path:
+    """
+    Get the data file, relative to Meta_data, that holds an entry.
+    
+    Args:
+        key: Source path key of the entry
+        mode: Output mode name
+        
+    Returns:
+        Relative path of the data file
+    """
+    if mode == 'consolidated':
+        return Path(CONSOLIDATED_FILENAME)
+    return Path(key).parent / POOL_DATA_FILENAME
+
+
+def _content_hash(transformed_data: Dict[str, Any]) -> str:
+    """
+    Hash a transformed entry, ignoring its processing timestamp.
+    
+    Args:
+        transformed_data: Transformed data dictionary
+        
+    Returns:
+        Hex digest identifying the entry's content
+    """
+    metadata = transformed_data.get('metadata', {})
+    stable = {
+        **transformed_data,
+        'metadata': {k: v for k, v in metadata.items() if k != 'processed_at'},
+    }
+    stable.pop(HASH_KEY, None)
+    return hashlib.blake2b(_dumps_compact(stable), digest_size=16).hexdigest()
+
+
+def _update_shard(shard_file: Path, entries: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Merge entries into a single shard file, preserving entries already on disk.
+    
+    Entries whose content hash matches the stored one are left as they
+    are, and the shard is only rewritten if at least one entry changed.
+    
+    Args:
+        shard_file: Path to the shard JSON file
+        entries: Mapping of source path to transformed data
+        
+    Returns:
+        Keys of the entries rewritten (empty if the shard was not written)
+    """
+    shard_data = {}
+    if shard_file.exists():
+        try:
+            shard_data = _read_json(shard_file)
+        except Exception as e:
+            logger.warning(f"Could not load existing data from {shard_file}: {e}. Starting fresh.")
+        if not isinstance(shard_data, dict):
+            logger.warning(f"Existing data in {shard_file} is not a JSON object. Starting fresh.")
+            shard_data = {}
+    
+    changed_keys = []
+    for key, transformed_data in entries.items():
+        content_hash = _content_hash(transformed_data)
+        stored = shard_data.get(key)
+        if isinstance(stored, dict) and stored.get(HASH_KEY) == content_hash:
+            continue
+        shard_data[key] = {**transformed_data, HASH_KEY: content_hash}
+        changed_keys.append(key)
+    
+    if not changed_keys:
+        logger.info(f"No changes for {len(entries)} entries in {shard_file}, skipping write")
+        return []
+    
+    try:
+        shard_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_json(shard_data, shard_file)
+        logger.info(f"Updated {len(changed_keys)} entries in {shard_file}, total entries: {len(shard_data)}")
+        return changed_keys
+    except Exception as e:
+        logger.error(f"Failed to save data to {shard_file}: {e}")
+        return []
 
 
 def save_to_metadata_folder(
     transformed_data_list: List[Dict[str, Any]], 
     metadata_dir: Path,
-    repo_root: Path
-) -> List[Path]:
+    repo_root: Path,
+    mode: str = DEFAULT_OUTPUT_MODE
+) -> Dict[Path, List[str]]:
     """
-    Save all transformed data to a single consolidated JSON file.
-    Updates only the entries for the files that were processed.
+    Save transformed data into the Meta_data folder.
+    
+    In 'consolidated' mode (the default) every entry goes to
+    Meta_data/all_pools_data.json. In 'sharded' mode entries are grouped
+    by the folder of their source file and written to
+    Meta_data/<folder>/pool_data.json.
+    Only files containing processed entries whose content actually changed
+    are rewritten; other files are left untouched.
     
     Args:
         transformed_data_list: List of transformed data dictionaries
         metadata_dir: Path to the Meta_data directory
         repo_root: Path to the repository root
+        mode: Output mode, one of OUTPUT_MODES
         
     Returns:
-        List of paths to saved files (single file in this case)
+        Mapping of each data file written to the keys of the entries rewritten in it
     """
-    output_file = metadata_dir / 'all_pools_data.json'
+    _check_mode(mode)
     
-    # Load existing data if available to preserve other files' data
-    all_data = {}
-    if output_file.exists():
-        try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                all_data = json.load(f)
-            logger.info(f"Loaded existing data with {len(all_data)} entries")
-        except Exception as e:
-            logger.warning(f"Could not load existing data from {output_file}: {e}. Starting fresh.")
-    
-    # Update data with new transformed items
-    updated_count = 0
+    # Group entries by the data file that holds them
+    shards: Dict[Path, Dict[str, Dict[str, Any]]] = {}
     for transformed_data in transformed_data_list:
         try:
-            # Use source_file (relative path) as the unique key
-            metadata = transformed_data.get('metadata', {})
-            relative_path = metadata.get('source_file')
+            key = _entry_key(transformed_data)
             
-            if not relative_path:
+            if not key:
                 logger.warning(f"Missing source_file in metadata for pool {transformed_data.get('pool_name')}, skipping item")
                 continue
             
-            # Normalize path separators to look cleaner in JSON
-            key = str(Path(relative_path).as_posix())
-            
-            all_data[key] = transformed_data
-            updated_count += 1
+            shards.setdefault(_output_file(key, mode), {})[key] = transformed_data
             
         except Exception as e:
             source_file = transformed_data.get('metadata', {}).get('source_file', 'unknown')
             logger.error(f"Error preparing data for {source_file}: {e}")
     
-    # Create parent directories
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    saved_files = {}
+    for output_file, entries in shards.items():
+        shard_file = metadata_dir / output_file
+        changed_keys = _update_shard(shard_file, entries)
+        if changed_keys:
+            saved_files[shard_file] = changed_keys
     
-    # Save back to file
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False, default=str)
-        
-        logger.info(f"Successfully updated {output_file}")
-        logger.info(f"Updated {updated_count} entries, total entries: {len(all_data)}")
-        
-        return [output_file]
+    return saved_files
+
+
+def load_all_pools_data(metadata_dir: Path, mode: str = DEFAULT_OUTPUT_MODE) -> Dict[str, Dict[str, Any]]:
+    """
+    Load every data file under Meta_data into one flat mapping.
+    
+    Args:
+        metadata_dir: Path to the Meta_data directory
+        mode: Output mode the data was saved with
         
-    except Exception as e:
-        logger.error(f"Failed to save consolidated data to {output_file}: {e}")
-        return []
+    Returns:
+        Mapping of source path to transformed data, across all data files
+    """
+    _check_mode(mode)
+    
+    all_data = {}
+    for shard_file in sorted(metadata_dir.rglob(_output_filename(mode))):
+        try:
+            shard_data = _read_json(shard_file)
+        except Exception as e:
+            logger.warning(f"Could not read {shard_file}: {e}")
+            continue
+        if not isinstance(shard_data, dict):
+            logger.warning(f"Skipping {shard_file}: not a JSON object")
+            continue
+        all_data.update(shard_data)
+    return all_data
 
 
 def save_summary_report(summary: Dict[str, Any], metadata_dir: Path) -> Path:
@@ -96,63 +298,269 @@ def save_summary_report(summary: Dict[str, Any], metadata_dir: Path) -> Path:
     # Create a timestamped filename for the latest run
     summary_path = metadata_dir / '_pipeline_summary.json'
     
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(summary, summary_path)
     
     logger.info(f"Saved pipeline summary to {summary_path}")
     
     return summary_path
 
 
-def generate_index_file(metadata_dir: Path, repo_root: Path) -> Path:
+def _index_record(key: str, data: Dict[str, Any], output_file: Path) -> Dict[str, Any]:
+    """
+    Build the index record for one transformed entry.
+    
+    Args:
+        key: Source path key of the entry
+        data: Transformed data dictionary
+        output_file: Shard file path, relative to Meta_data
+        
+    Returns:
+        Index record dictionary
+    """
+    metadata = data.get('metadata', {})
+    
+    return {
+        'output_file': output_file.as_posix(),
+        'source_file': metadata.get('source_file', key),
+        'folder_path': metadata.get('folder_path'),
+        'processed_at': metadata.get('processed_at'),
+        'size': data.get('size'),
+    }
+
+
+def _is_current_record(record: Dict[str, Any]) -> bool:
     """
-    Generate an index file listing all processed files and their metadata.
+    Check whether an index record read from disk has every current field.
     
     Args:
+        record: Index record dictionary
+        
+    Returns:
+        True if the record can be reused as is
+    """
+    return all(field in record for field in INDEX_FIELDS)
+
+
+def _dumps_compact(data: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON.
+    
+    Args:
+        data: JSON-serializable data (unknown types are stringified)
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _write_index(
+    records: List[Dict[str, Any]],
+    metadata_dir: Path,
+    last_index_mtime: Optional[float] = None,
+    generated_at: Optional[str] = None
+) -> Path:
+    """
+    Sort index records and write them to Meta_data/_index.json.
+    
+    The outer object is framed by hand and records are encoded one at a
+    time, so the whole index is never held as a single encoded document.
+    
+    Args:
+        records: Index records
         metadata_dir: Path to the Meta_data directory
-        repo_root: Path to the repository root
+        last_index_mtime: Time up to which all shards are reflected in records
+        generated_at: Optional batch timestamp (defaults to now)
         
     Returns:
         Path to the index file
     """
-    index_data = {
-        'generated_at': datetime.utcnow().isoformat(timespec='seconds'),
-        'files': []
-    }
+    if generated_at is None:
+        from datetime import datetime, timezone
+        generated_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    
+    # Sort by source file path
+    records.sort(key=lambda x: x.get('source_file') or '')
+    
+    index_path = metadata_dir / INDEX_FILENAME
+    with open(index_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b'{"generated_at":' + _dumps_compact(generated_at) + b',"files":[')
+        for i, record in enumerate(records):
+            f.write(b'\n' if i == 0 else b',\n')
+            f.write(_dumps_compact(record))
+        f.write(b'\n],"total_files":' + str(len(records)).encode('ascii'))
+        if last_index_mtime is not None:
+            f.write(b',"last_index_mtime":' + _dumps_compact(last_index_mtime))
+        f.write(b'}\n')
+    
+    logger.info(f"Generated index file with {len(records)} entries")
+    
+    return index_path
+
+
+def generate_index_file(
+    transformed_data_list: List[Dict[str, Any]],
+    saved_files: Dict[Path, List[str]],
+    metadata_dir: Path,
+    mode: str = DEFAULT_OUTPUT_MODE,
+    generated_at: Optional[str] = None
+) -> Path:
+    """
+    Update the index file from the entries saved in this run.
+    
+    Records are built from the in-memory transformed data rather than by
+    re-reading the shards just written. Records from the existing index
+    are carried over for files that were not processed in this run; if
+    there is no readable index yet, it is rebuilt from every data file.
     
-    # Find all JSON files in Meta_data (excluding special files)
-    for json_file in metadata_dir.rglob('*.json'):
-        if json_file.name.startswith('_'):
+    Args:
+        transformed_data_list: List of transformed data dictionaries
+        saved_files: Data files and rewritten keys from save_to_metadata_folder
+        metadata_dir: Path to the Meta_data directory
+        mode: Output mode the data was saved with
+        generated_at: Optional batch timestamp (defaults to now)
+        
+    Returns:
+        Path to the index file
+    """
+    _check_mode(mode)
+    
+    saved_keys = {key for keys in saved_files.values() for key in keys}
+    new_records = {}
+    
+    for data in transformed_data_list:
+        key = _entry_key(data)
+        # Skip entries left unchanged on disk; their existing records still apply
+        if key not in saved_keys:
             continue
         
+        new_records[key] = _index_record(key, data, _output_file(key, mode))
+    
+    index_path = metadata_dir / INDEX_FILENAME
+    if not index_path.exists():
+        # Data files may hold entries from earlier runs, so index everything on disk
+        return rebuild_index_file(metadata_dir, mode, generated_at)
+    
+    if not new_records:
+        logger.info("No saved entries, index left unchanged")
+        return index_path
+    
+    try:
+        existing = _read_json(index_path)
+        existing_records = existing.get('files', [])
+        if not all(_is_current_record(record) for record in existing_records):
+            logger.info(f"Index {index_path} has outdated records, rebuilding from all data files")
+            return rebuild_index_file(metadata_dir, mode, generated_at)
+        records = [
+            record for record in existing_records
+            if record.get('source_file') not in new_records
+        ]
+        # Shards saved in this run are newer, so a later rebuild re-parses them
+        last_index_mtime = existing.get('last_index_mtime')
+    except Exception as e:
+        logger.warning(f"Could not read existing index {index_path}: {e}. Rebuilding from all data files.")
+        return rebuild_index_file(metadata_dir, mode, generated_at)
+    
+    records.extend(new_records.values())
+    
+    return _write_index(records, metadata_dir, last_index_mtime, generated_at)
+
+
+def _scan_shards(directory: str, filename: str) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory tree with os.scandir, yielding data file entries.
+    
+    Args:
+        directory: Directory to walk
+        filename: Name of the data files to yield
+        
+    Yields:
+        DirEntry objects for each data file found
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_shards(entry.path, filename)
+            elif entry.name == filename:
+                yield entry
+
+
+def rebuild_index_file(
+    metadata_dir: Path,
+    mode: str = DEFAULT_OUTPUT_MODE,
+    generated_at: Optional[str] = None
+) -> Path:
+    """
+    Rebuild the index file by scanning every data file on disk.
+    
+    Files not modified since the last rebuild (tracked by
+    last_index_mtime in the index) keep their existing records; only
+    newer files are parsed.
+    
+    Args:
+        metadata_dir: Path to the Meta_data directory
+        mode: Output mode the data was saved with
+        generated_at: Optional batch timestamp (defaults to now)
+        
+    Returns:
+        Path to the index file
+    """
+    _check_mode(mode)
+    
+    # Taken before scanning so shards written during the scan are re-parsed next time
+    scan_started = time.time()
+    
+    cached_records: Dict[str, List[Dict[str, Any]]] = {}
+    last_index_mtime = None
+    index_path = metadata_dir / INDEX_FILENAME
+    if index_path.exists():
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            metadata = data.get('metadata', {})
-            stats = data.get('statistics', {})
-            
-            index_data['files'].append({
-                'output_file': str(json_file.relative_to(metadata_dir)),
-                'source_file': metadata.get('source_file'),
-                'parent_folder': metadata.get('parent_folder'),
-                'processed_at': metadata.get('processed_at'),
-                'line_count': stats.get('total_lines'),
-            })
+            existing = _read_json(index_path)
+            last_index_mtime = existing.get('last_index_mtime')
+            for record in existing.get('files', []):
+                cached_records.setdefault(record.get('output_file'), []).append(record)
+            # Data files with outdated records are parsed again
+            cached_records = {
+                output_file: file_records for output_file, file_records in cached_records.items()
+                if all(_is_current_record(record) for record in file_records)
+            }
         except Exception as e:
-            logger.warning(f"Could not read {json_file} for index: {e}")
+            logger.warning(f"Could not read existing index {index_path}: {e}. Parsing all shards.")
     
-    # Sort by source file path
-    index_data['files'].sort(key=lambda x: x.get('source_file', ''))
-    index_data['total_files'] = len(index_data['files'])
+    records = []
+    parsed = 0
     
-    index_path = metadata_dir / '_index.json'
-    with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump(index_data, f, indent=2, ensure_ascii=False)
+    # Each data file holds a mapping of source path to entry
+    for entry in _scan_shards(str(metadata_dir), _output_filename(mode)):
+        output_file = Path(entry.path).relative_to(metadata_dir)
+        cached = cached_records.get(output_file.as_posix())
+        
+        if last_index_mtime is not None and cached is not None and entry.stat().st_mtime <= last_index_mtime:
+            records.extend(cached)
+            continue
+        
+        try:
+            shard_data = _read_json(Path(entry.path))
+        except Exception as e:
+            logger.warning(f"Could not read {entry.path} for index: {e}")
+            continue
+        
+        if not isinstance(shard_data, dict):
+            logger.warning(f"Skipping {entry.path} for index: not a JSON object")
+            continue
+        
+        parsed += 1
+        for key, data in shard_data.items():
+            if not isinstance(data, dict):
+                logger.warning(f"Skipping malformed entry {key} in {entry.path} for index")
+                continue
+            records.append(_index_record(key, data, output_file))
     
-    logger.info(f"Generated index file with {len(index_data['files'])} entries")
+    logger.info(f"Parsed {parsed} modified shards for index")
     
-    return index_path
+    return _write_index(records, metadata_dir, scan_started, generated_at)
 
 
 def save_as_csv(
@@ -188,7 +596,7 @@ def save_as_csv(
         'detected_format'
     ]
     
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         
@@ -6,12 +6,19 @@ Extracts data from .pol files, transforms it, and saves to Meta_data folder.
 import os
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 from datetime import datetime, timezone
 
 from extract import extract_all_pol_files, get_changed_pol_files
-from transform import transform_pol_data, generate_aggregated_summary, load_game_lookup
-from load import save_to_metadata_folder, save_summary_report
+from transform import (
+    generate_aggregated_summary,
+    get_pool_index,
+    init_transform_worker,
+    load_game_lookup,
+    transform_pol_data_safe,
+)
+from load import save_to_metadata_folder, save_summary_report, generate_index_file, rebuild_index_file
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Task batches handed to each transform worker; more batches balance uneven file sizes
+TRANSFORM_CHUNKS_PER_WORKER = 4
+
 
 def get_repo_root() -> Path:
     """Get the repository root directory."""
@@ -80,9 +90,12 @@ def run_pipeline(process_all: bool = False):
     else:
         # Try to get only changed files first
         pol_files_data = get_changed_pol_files(repo_root)
-        if not pol_files_data:
-            logger.info("No changed .pol files detected, processing all files...")
+        if pol_files_data is None:
+            logger.info("Could not determine changed files from git, processing all files...")
             pol_files_data = extract_all_pol_files(repo_root)
+        elif not pol_files_data:
+            logger.info("No changed .pol files to process, nothing to do")
+            return
     
     if not pol_files_data:
         logger.warning("No .pol files found to process")
@@ -100,22 +113,34 @@ def run_pipeline(process_all: bool = False):
     transformed_data = []
     errors = []
     
-    for file_info in pol_files_data:
-        try:
-            result = transform_pol_data(file_info, game_df)
-            transformed_data.append(result)
-            
-            # Log key metrics
-            rtp_str = f"RTP={result.get('rtp')}%" if result.get('rtp') else "RTP=N/A"
-            vol_str = f"Vol={result.get('volatility')}" if result.get('volatility') else "Vol=N/A"
-            logger.info(f"✓ Transformed: {file_info['relative_path']} | {rtp_str} | {vol_str}")
-        except Exception as e:
-            error_msg = f"✗ Error transforming {file_info['relative_path']}: {str(e)}"
-            logger.error(error_msg)
-            errors.append({
-                'file': file_info['relative_path'],
-                'error': str(e)
-            })
+    # One timestamp for the whole batch
+    batch_timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    
+    # Transform is CPU-bound, so spread files across processes
+    processes = min(os.cpu_count() or 1, len(pol_files_data))
+    chunksize = max(1, len(pol_files_data) // (processes * TRANSFORM_CHUNKS_PER_WORKER))
+    with multiprocessing.Pool(
+        processes, initializer=init_transform_worker, initargs=(get_pool_index(), batch_timestamp)
+    ) as pool:
+        # imap keeps results in input order
+        outcomes = pool.imap(transform_pol_data_safe, pol_files_data, chunksize=chunksize)
+        
+        for file_info, (ok, outcome) in zip(pol_files_data, outcomes):
+            if ok:
+                result = outcome
+                transformed_data.append(result)
+                
+                # Log key metrics
+                rtp_str = f"RTP={result.get('rtp')}%" if result.get('rtp') else "RTP=N/A"
+                vol_str = f"Vol={result.get('volatility')}" if result.get('volatility') else "Vol=N/A"
+                logger.info(f"✓ Transformed: {file_info.relative_path} | {rtp_str} | {vol_str}")
+            else:
+                error_msg = f"✗ Error transforming {file_info.relative_path}: {outcome}"
+                logger.error(error_msg)
+                errors.append({
+                    'file': file_info.relative_path,
+                    'error': outcome
+                })
     
     logger.info(f"Successfully transformed {len(transformed_data)} files")
     if errors:
@@ -131,9 +156,11 @@ def run_pipeline(process_all: bool = False):
     saved_files = save_to_metadata_folder(transformed_data, metadata_dir, repo_root)
     logger.info(f"Saved {len(saved_files)} files to Meta_data/")
     
+    generate_index_file(transformed_data, saved_files, metadata_dir, generated_at=batch_timestamp)
+    
     # Generate summary report
     summary = {
-        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'timestamp': batch_timestamp,
         'total_files_processed': len(pol_files_data),
         'successful_transforms': len(transformed_data),
         'failed_transforms': len(errors),
@@ -143,7 +170,7 @@ def run_pipeline(process_all: bool = False):
     
     # Add aggregated statistics across all files
     if transformed_data:
-        summary['aggregated'] = generate_aggregated_summary(transformed_data)
+        summary['aggregated'] = generate_aggregated_summary(transformed_data, batch_timestamp)
     
     save_summary_report(summary, metadata_dir)
     logger.info("Pipeline completed successfully!")
@@ -160,6 +187,14 @@ if __name__ == '__main__':
         action='store_true', 
         help='Process all .pol files instead of just changed ones'
     )
+    parser.add_argument(
+        '--rebuild-index',
+        action='store_true',
+        help='Rebuild Meta_data/_index.json from the saved data and exit'
+    )
     args = parser.parse_args()
     
-    run_pipeline(process_all=args.all)
+    if args.rebuild_index:
+        rebuild_index_file(get_repo_root() / 'Meta_data')
+    else:
+        run_pipeline(process_all=args.all)
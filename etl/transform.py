@@ -9,19 +9,97 @@ Example:
     515 TB2
 """
 
+import io
 import re
+import csv
+import hashlib
 import logging
+import warnings
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterator, List, Tuple, Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 from collections import Counter
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - falls back to the Python line parser
+    njit = None
+
+if TYPE_CHECKING:
+    # Relative under the etl package, top-level when run as a script
+    try:
+        from .extract import PolFileMeta
+    except ImportError:
+        from extract import PolFileMeta
+
 logger = logging.getLogger(__name__)
 
-# Global game lookup dataframe - loaded once
+# Directory (under the repository root) for local caches
+CACHE_DIR_NAME = '.cache'
+
+# Extension of pool data files, stripped before parsing the filename
+POL_SUFFIX = '.pol'
+
+# Lookup entry for a pool: (min bet, game ids)
+PoolEntry = Tuple[float, List[str]]
+
+# Pool lookup index: (entries by Pool_id, entries by numeric Pool_id value)
+PoolIndex = Tuple[Dict[str, PoolEntry], Dict[int, PoolEntry]]
+
+# Global game lookup dataframe and its pool index - loaded once
 _game_df: Optional[pd.DataFrame] = None
+_pool_index: Optional[PoolIndex] = None
+
+# Pool index and batch timestamp used inside transform worker processes
+_worker_pool_index: Optional[PoolIndex] = None
+_worker_processed_at: Optional[str] = None
+
+
+def _read_game_lookup(path: Path, repo_root: Path) -> pd.DataFrame:
+    """
+    Read the game lookup spreadsheet, using a pickle cache when possible.
+    
+    The cache lives in repo_root/.cache and is keyed on the spreadsheet's
+    size and modification time, so editing the file invalidates it.
+    
+    Args:
+        path: Path to the lookup spreadsheet
+        repo_root: Path to the repository root
+        
+    Returns:
+        DataFrame with game lookup data
+    """
+    stat = path.stat()
+    key = hashlib.sha1(f"{path.name}-{stat.st_size}-{stat.st_mtime_ns}".encode()).hexdigest()
+    cache_dir = repo_root / CACHE_DIR_NAME
+    cache_file = cache_dir / f'game_lookup_{key}.pkl'
+    
+    if cache_file.exists():
+        try:
+            return pd.read_pickle(cache_file)
+        except Exception as e:
+            logger.warning(f"Could not read game lookup cache {cache_file}: {e}")
+    
+    try:
+        game_df = pd.read_excel(path, engine='calamine')
+    except ImportError:
+        # python-calamine not installed, use the default (openpyxl) reader
+        game_df = pd.read_excel(path)
+    
+    game_df['Game_id'] = game_df['Game_id'].astype(str)
+    game_df['Pool_id'] = game_df['Pool_id'].astype(str)
+    
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        for stale in cache_dir.glob('game_lookup_*.pkl'):
+            stale.unlink()
+        game_df.to_pickle(cache_file)
+    except Exception as e:
+        logger.warning(f"Could not write game lookup cache {cache_file}: {e}")
+    
+    return game_df
 
 
 def load_game_lookup(repo_root: Path) -> Optional[pd.DataFrame]:
@@ -34,7 +112,7 @@ def load_game_lookup(repo_root: Path) -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with game lookup data or None if not found
     """
-    global _game_df
+    global _game_df, _pool_index
     
     if _game_df is not None:
         return _game_df
@@ -49,15 +127,213 @@ def load_game_lookup(repo_root: Path) -> Optional[pd.DataFrame]:
     for path in possible_paths:
         if path.exists():
             logger.info(f"Loading game lookup from: {path}")
-            _game_df = pd.read_excel(path)
-            _game_df['Game_id'] = _game_df['Game_id'].astype(str)
-            _game_df['Pool_id'] = _game_df['Pool_id'].astype(str)
+            _game_df = _read_game_lookup(path, repo_root)
+            _pool_index = build_pool_index(_game_df)
             return _game_df
     
     logger.warning("game_id_to_pools.xlsx not found. Some calculations will be skipped.")
     return None
 
 
+def get_pool_index() -> Optional[PoolIndex]:
+    """
+    Get the pool index built by load_game_lookup.
+    
+    Returns:
+        PoolIndex or None if the game lookup has not been loaded
+    """
+    return _pool_index
+
+
+def build_pool_index(game_df: pd.DataFrame) -> PoolIndex:
+    """
+    Index the game lookup by Pool_id for O(1) per-file lookups.
+    
+    Args:
+        game_df: Game lookup DataFrame
+        
+    Returns:
+        PoolIndex mapping pool ids to (min bet, game ids)
+    """
+    by_id = {
+        pool_id: (float(group['Bet'].iloc[0]), group['Game_id'].tolist())
+        for pool_id, group in game_df.groupby('Pool_id', sort=False)
+    }
+    
+    # Each number maps to one spelling's rows: the unpadded one ('201') if
+    # the lookup has it, otherwise the first spelling listed ('0201')
+    by_number = {}
+    for pool_id, entry in by_id.items():
+        if not pool_id.isdecimal():
+            continue
+        number = int(pool_id)
+        if str(number) == pool_id:
+            by_number[number] = entry
+        else:
+            by_number.setdefault(number, entry)
+    
+    return by_id, by_number
+
+
+def lookup_pool(pool_index: PoolIndex, pool_id: str) -> Optional[PoolEntry]:
+    """
+    Find the lookup entry for a pool id.
+    
+    Tries an exact match, then (for numeric ids) a lookup id with the same
+    numeric value, ignoring leading zeros.
+    
+    Args:
+        pool_index: Index built by build_pool_index
+        pool_id: Pool id from the filename
+        
+    Returns:
+        (min bet, game ids) or None if the pool is not in the lookup
+    """
+    by_id, by_number = pool_index
+    entry = by_id.get(pool_id)
+    if entry is None and pool_id.isdecimal():
+        entry = by_number.get(int(pool_id))
+    return entry
+
+
+def _iter_pol_values(content: str) -> Iterator[int]:
+    """
+    Yield the game win of each parseable .pol line.
+    
+    Args:
+        content: Raw file content
+        
+    Returns:
+        Iterator of values (main value plus extra value, if any)
+    """
+    for line in content.strip().split('\n'):
+        parts = line.split()
+        if not parts:
+            continue
+        try:
+            value = int(parts[0])
+        except ValueError:
+            continue
+        # Handle third column (extra value to add)
+        if len(parts) >= 3:
+            try:
+                value += int(parts[2])
+            except ValueError:
+                pass
+        yield value
+
+
+def _scan_pol_buffer(buf: np.ndarray) -> Tuple[np.ndarray, bool]:
+    """
+    Parse ASCII .pol content byte by byte (compiled with numba when available).
+    
+    Follows _iter_pol_values: lines whose first token is not an integer are
+    skipped and a non-integer extra value is ignored. Tokens Python's int()
+    treats specially (digit separators, more than 18 digits) abort the scan.
+    
+    Args:
+        buf: File content as a uint8 array
+        
+    Returns:
+        (game win values, True) or (empty array, False) if the scan was aborted
+    """
+    n = buf.shape[0]
+    lines = 1
+    for i in range(n):
+        if buf[i] == 10:
+            lines += 1
+    out = np.empty(lines, dtype=np.int64)
+    count = 0
+    
+    i = 0
+    while i < n:
+        value = 0
+        has_value = False
+        token = 0
+        # One line: walk its whitespace separated tokens
+        while i < n and buf[i] != 10:
+            c = buf[i]
+            if c == 32 or 9 <= c <= 13 or 28 <= c <= 31:
+                i += 1
+                continue
+            start = i
+            while i < n and not (buf[i] == 32 or 9 <= buf[i] <= 13 or 28 <= buf[i] <= 31):
+                i += 1
+            
+            # Only the value (1st) and extra value (3rd) columns are parsed
+            if token == 0 or (token == 2 and has_value):
+                j = start
+                negative = False
+                if buf[j] == 43 or buf[j] == 45:
+                    negative = buf[j] == 45
+                    j += 1
+                digits = i - j
+                parsed = 0
+                valid = digits > 0
+                separator = False
+                for k in range(j, i):
+                    d = buf[k]
+                    if d == 95:
+                        separator = True
+                    elif 48 <= d <= 57:
+                        parsed = parsed * 10 + (int(d) - 48)
+                    else:
+                        valid = False
+                if valid and (separator or digits > 18):
+                    return out[:0], False
+                if valid:
+                    if negative:
+                        parsed = -parsed
+                    if token == 0:
+                        value = parsed
+                        has_value = True
+                    else:
+                        value += parsed
+            token += 1
+        i += 1
+        if has_value:
+            out[count] = value
+            count += 1
+    
+    return out[:count], True
+
+
+# Compiled byte parser for large fallback files (None without numba)
+_parse_pol_buffer = njit(cache=True, nogil=True)(_scan_pol_buffer) if njit is not None else None
+
+
+def _parse_pol_lines(content: str) -> pd.DataFrame:
+    """
+    Parse .pol file content line by line in Python.
+    
+    Slow path used when the content is not clean enough for the
+    vectorized parser; malformed tokens are skipped individually.
+    
+    Args:
+        content: Raw file content
+        
+    Returns:
+        DataFrame with 'game_win' column
+    """
+    if _parse_pol_buffer is not None and content.isascii():
+        buf = np.frombuffer(content.encode('ascii'), dtype=np.uint8)
+        game_win, complete = _parse_pol_buffer(buf)
+        if complete:
+            return pd.DataFrame({'game_win': game_win})
+    
+    try:
+        game_win = np.fromiter(_iter_pol_values(content), dtype=np.int64)
+    except OverflowError:
+        # Values beyond int64 stay Python ints (object column)
+        game_win = list(_iter_pol_values(content))
+    
+    return pd.DataFrame({'game_win': game_win})
+
+
+# Whitespace str.split() separates on but pandas' tokenizer does not
+_NON_TOKENIZER_WHITESPACE_RE = re.compile(r'[\x0b\x0c\x1c-\x1f]')
+
+
 def parse_pol_content(content: str) -> pd.DataFrame:
     """
     Parse .pol file content into a DataFrame.
@@ -65,34 +341,60 @@ def parse_pol_content(content: str) -> pd.DataFrame:
     Handles format: "<value> <type_code>" or "<value> <type_code> <extra_value>"
     Extra value (if present) gets added to the main value.
     
+    Content is parsed with pandas' C tokenizer; anything it cannot split the
+    same way str.split() does, or any value/extra token that is not a plain
+    integer, falls back to the line-by-line parser.
+    
     Args:
         content: Raw file content
         
     Returns:
         DataFrame with 'game_win' column
-    """
-    lines = content.strip().split('\n')
     
-    # Parse into dataframe
-    data = []
-    for line in lines:
-        parts = line.strip().split()
-        if len(parts) >= 1:
-            try:
-                value = int(parts[0])
-                # Handle third column (extra value to add)
-                if len(parts) >= 3:
-                    try:
-                        extra = int(parts[2])
-                        value += extra
-                    except (ValueError, IndexError):
-                        pass
-                data.append(value)
-            except ValueError:
-                continue
-    
-    df = pd.DataFrame({'game_win': data})
-    return df
+    Regression cases (python -m doctest etl/transform.py):
+        >>> parse_pol_content('100 2 5 7\\n200 3\\n')['game_win'].tolist()
+        [105, 200]
+        >>> parse_pol_content('1.0 TB2\\n5 TB2')['game_win'].tolist()
+        [5]
+        >>> parse_pol_content('1e3 TB2\\n5 TB2')['game_win'].tolist()
+        [5]
+        >>> parse_pol_content('5 "TB 2" 3')['game_win'].tolist()
+        [5]
+    """
+    if (
+        not content.isascii()
+        or _NON_TOKENIZER_WHITESPACE_RE.search(content)
+        # A lone carriage return ends a row for pandas but not for split('\n')
+        or content.count('\r') != content.count('\r\n')
+    ):
+        return _parse_pol_lines(content)
+    
+    try:
+        with warnings.catch_warnings():
+            # Rows with more than 3 fields are truncated, as the line parser does
+            warnings.simplefilter('ignore', pd.errors.ParserWarning)
+            df = pd.read_csv(
+                io.StringIO(content),
+                sep=r'\s+',
+                header=None,
+                names=['value', 'type_code', 'extra'],
+                index_col=False,
+                quoting=csv.QUOTE_NONE,
+                dtype={'value': str, 'type_code': 'category', 'extra': str},
+                keep_default_na=False,
+                na_values=[''],
+                engine='c',
+            )
+        # Converting the raw tokens applies int()'s rules, so '1.0' or '1e3' is rejected
+        game_win = df['value'].astype(np.int64).to_numpy()
+        has_extra = df['extra'].notna().to_numpy()
+        if has_extra.any():
+            game_win[has_extra] += df['extra'][has_extra].astype(np.int64).to_numpy()
+    except (ValueError, TypeError, OverflowError):
+        # Includes pandas ParserError/EmptyDataError (ValueError subclasses)
+        return _parse_pol_lines(content)
+    
+    return pd.DataFrame({'game_win': game_win})
 
 
 def calculate_volatility(df: pd.DataFrame, min_bet: float, rtp: float) -> float:
@@ -107,26 +409,40 @@ def calculate_volatility(df: pd.DataFrame, min_bet: float, rtp: float) -> float:
     Returns:
         Volatility value
     """
-    n = len(df)
-    
-    # Get value counts
-    stats = pd.DataFrame(df['game_win'].value_counts())
-    stats = stats.reset_index()
-    stats.columns = ['winning', 'count']
-    stats = stats.sort_values(by=['winning'])
+    return _volatility_from_wins(df['game_win'].to_numpy(), min_bet, rtp)
+
+
+def _volatility_from_wins(wins: np.ndarray, min_bet: float, rtp: float) -> float:
+    """
+    Calculate volatility at 90% CI (z=1.645) from an array of game wins.
     
-    # Calculate metrics
-    stats['win/bet'] = stats['winning'] / min_bet
-    stats['freq%'] = stats['count'] / n
-    stats['variance'] = (stats['freq%'] * (stats['win/bet'] - (rtp / 100)) ** 2).round(4)
+    Args:
+        wins: Game win values
+        min_bet: Minimum bet amount
+        rtp: RTP percentage
+        
+    Returns:
+        Volatility value
+    """
+    # Distinct winnings (sorted) and their counts
+    winning, count = np.unique(wins, return_counts=True)
     
-    variance = stats['variance'].sum()
+    # Each value's variance contribution is rounded to 4 places before summing
+    freq = count / len(wins)
+    variance = np.round(freq * (winning / min_bet - rtp / 100) ** 2, 4).sum()
     sd = np.sqrt(variance)
     volatility = round(1.645 * sd, 2)
     
     return float(volatility)
 
 
+# Tags for pool types longer than 4 digits, keyed on the first digit
+_LONG_POOL_TAGS = {'5': ('PFB',)}
+
+# Tag for pool types that match no other rule
+_DEFAULT_TAG = ('REG',)
+
+
 def classify_pool(pool_type: str) -> Dict[str, Any]:
     """
     Classify pool based on pool_type number.
@@ -138,20 +454,20 @@ def classify_pool(pool_type: str) -> Dict[str, Any]:
         Dictionary with classification info
     """
     pool_type_str = str(pool_type)
+    first = pool_type_str[:1]
+    is_long = len(pool_type_str) > 4
     
     # Determine tag
     if pool_type_str == '395':
         tag = ['GAB','PFB']
-    elif len(pool_type_str) > 4 and pool_type_str[0] == '5':
-        tag = ['PFB']
     else:
-        tag = ['REG']
+        tag = list(_LONG_POOL_TAGS.get(first, _DEFAULT_TAG) if is_long else _DEFAULT_TAG)
     
     # Determine if flat
     is_flat = 0
     max_multiplier = None
     
-    if len(pool_type_str) > 4 and pool_type_str[0] == '4':
+    if is_long and first == '4':
         is_flat = 1
         max_multiplier = pool_type_str[-4:]
     
@@ -162,24 +478,31 @@ def classify_pool(pool_type: str) -> Dict[str, Any]:
     }
 
 
-def transform_pol_data(file_info: Dict[str, Any], game_df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+def transform_pol_data(
+    file_info: 'PolFileMeta',
+    game_df: Optional[pd.DataFrame] = None,
+    pool_index: Optional[PoolIndex] = None,
+    processed_at: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Main transformation function for .pol pool data files.
     
     Calculates RTP, volatility, hit frequency based on game lookup data.
     
     Args:
-        file_info: Dictionary containing file metadata and content
-        game_df: Optional game lookup DataFrame
+        file_info: Extracted file metadata and content
+        game_df: Optional game lookup DataFrame (used if pool_index is not given)
+        pool_index: Optional pool index from build_pool_index
+        processed_at: Optional batch timestamp (defaults to now)
         
     Returns:
         Transformed data dictionary ready for loading
     """
-    content = file_info.get('content', '')
-    filename = file_info.get('file_name', '')
+    content = file_info.content
+    filename = file_info.file_name
     
     # Extract pool info from filename (Pool_0201_395.pol)
-    name = filename.replace('.pol', '')
+    name = filename[:-len(POL_SUFFIX)] if filename.endswith(POL_SUFFIX) else filename
     splits = name.split('_')
     
     pool_id = splits[1] if len(splits) > 1 else None
@@ -196,43 +519,34 @@ def transform_pol_data(file_info: Dict[str, Any], game_df: Optional[pd.DataFrame
     volatility = None
     hit_freq = None
     
+    if pool_index is None and game_df is not None:
+        pool_index = _pool_index if game_df is _game_df else build_pool_index(game_df)
+    
     # Get min_bet and game_ids from lookup
-    if game_df is not None and pool_id is not None:
-        # Try exact match first
-        tmp = game_df[game_df['Pool_id'] == pool_id]
-        
-        # If no match, try without leading zeros
-        if tmp.empty:
-            pool_id_stripped = pool_id.lstrip('0') or '0'
-            tmp = game_df[game_df['Pool_id'] == pool_id_stripped]
-        
-        # If still no match, try padding the lookup values
-        if tmp.empty:
-            tmp = game_df[game_df['Pool_id'].str.zfill(4) == pool_id]
-        
-        if not tmp.empty:
-            min_bet = float(tmp['Bet'].iloc[0])
-            game_ids = tmp['Game_id'].tolist()
+    if pool_index is not None and pool_id is not None:
+        entry = lookup_pool(pool_index, pool_id)
+        if entry is not None:
+            min_bet = entry[0]
+            game_ids = list(entry[1])
     
     # Calculate metrics if we have min_bet
     if min_bet is not None and min_bet > 0 and size > 0:
+        wins = df['game_win'].to_numpy()
+        
         # RTP = sum(wins) / (count * min_bet) * 100
-        total_win = df['game_win'].sum()
+        total_win = wins.sum()
         rtp = round(float(total_win / (size * min_bet)) * 100, 2)
         
         # Hit Frequency = count(win > 0) / total_count * 100
-        hits = len(df[df['game_win'] > 0])
+        hits = int(np.count_nonzero(wins > 0))
         hit_freq = round((hits / size) * 100, 2)
         
         # Volatility at 90% CI
-        volatility = calculate_volatility(df, min_bet, rtp)
+        volatility = _volatility_from_wins(wins, min_bet, rtp)
     
     # Classify pool
     classification = classify_pool(pool_type) if pool_type else {'tag': 'UNKNOWN', 'is_flat': 0, 'max_multiplier': None}
     
-    # Basic statistics
-    values = df['game_win'].tolist()
-    
     # Build result
     result = {
         'pool_name': filename,
@@ -247,10 +561,10 @@ def transform_pol_data(file_info: Dict[str, Any], game_df: Optional[pd.DataFrame
         'size': size,
         'max_multiplier': classification['max_multiplier'],
         'metadata': {
-            'source_file': file_info.get('relative_path'),
+            'source_file': file_info.relative_path,
             'file_name': filename,
-            'folder_path': file_info.get('folder_path'),
-            'processed_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'folder_path': file_info.folder_path,
+            'processed_at': processed_at or datetime.now(timezone.utc).isoformat(timespec='seconds'),
             'hit_frequency': hit_freq
         }
     }
@@ -258,12 +572,50 @@ def transform_pol_data(file_info: Dict[str, Any], game_df: Optional[pd.DataFrame
     return result
 
 
-def generate_aggregated_summary(all_transformed: List[Dict[str, Any]]) -> Dict[str, Any]:
+def init_transform_worker(pool_index: Optional[PoolIndex], processed_at: Optional[str] = None) -> None:
+    """
+    Initializer for transform worker processes.
+    
+    Receives the prebuilt pool index so workers neither reload the lookup
+    nor rebuild the index.
+    
+    Args:
+        pool_index: Pool index from build_pool_index (or None)
+        processed_at: Batch timestamp stamped on every transformed file
+    """
+    global _worker_pool_index, _worker_processed_at
+    _worker_pool_index = pool_index
+    _worker_processed_at = processed_at
+
+
+def transform_pol_data_safe(file_info: 'PolFileMeta') -> Tuple[bool, Any]:
+    """
+    Run transform_pol_data in a worker, capturing any exception.
+    
+    Args:
+        file_info: Extracted file metadata and content
+        
+    Returns:
+        (True, transformed data) on success, (False, error message) on failure
+    """
+    try:
+        return True, transform_pol_data(
+            file_info, pool_index=_worker_pool_index, processed_at=_worker_processed_at
+        )
+    except Exception as e:
+        return False, str(e)
+
+
+def generate_aggregated_summary(
+    all_transformed: List[Dict[str, Any]],
+    generated_at: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Generate an aggregated summary across all processed .pol files.
     
     Args:
         all_transformed: List of all transformed data dictionaries
+        generated_at: Optional batch timestamp (defaults to now)
         
     Returns:
         Aggregated summary dictionary
@@ -271,52 +623,35 @@ def generate_aggregated_summary(all_transformed: List[Dict[str, Any]]) -> Dict[s
     if not all_transformed:
         return {}
     
-    total_records = 0
-    tags_count = Counter()
-    files_by_folder = Counter()
-    rtp_values = []
-    volatility_values = []
+    total_records = sum(data.get('size', 0) for data in all_transformed)
     
-    for data in all_transformed:
-        total_records += data.get('size', 0)
-        
-        if data.get('tag'):
-            tags = data['tag']
-            if isinstance(tags, list):
-                for tag in tags:
-                    tags_count[tag] += 1
-            else:
-                tags_count[tags] += 1
-        
-        if data.get('rtp') is not None:
-            rtp_values.append(data['rtp'])
-        
-        if data.get('volatility') is not None:
-            volatility_values.append(data['volatility'])
-        
-        folder = data.get('metadata', {}).get('parent_folder', 'root')
-        files_by_folder[folder] += 1
+    tags_count = Counter(
+        tag
+        for data in all_transformed if data.get('tag')
+        for tag in (data['tag'] if isinstance(data['tag'], list) else (data['tag'],))
+    )
+    files_by_folder = Counter(
+        data.get('metadata', {}).get('parent_folder', 'root') for data in all_transformed
+    )
     
     summary = {
         'total_files_processed': len(all_transformed),
         'total_records_across_all_files': total_records,
         'tags_distribution': dict(tags_count),
         'files_by_folder': dict(files_by_folder),
-        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds')
+        'generated_at': generated_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
     }
     
-    if rtp_values:
-        summary['rtp_stats'] = {
-            'min': min(rtp_values),
-            'max': max(rtp_values),
-            'avg': round(sum(rtp_values) / len(rtp_values), 2)
-        }
-    
-    if volatility_values:
-        summary['volatility_stats'] = {
-            'min': min(volatility_values),
-            'max': max(volatility_values),
-            'avg': round(sum(volatility_values) / len(volatility_values), 2)
-        }
+    for metric in ('rtp', 'volatility'):
+        values = np.fromiter(
+            (data[metric] for data in all_transformed if data.get(metric) is not None),
+            dtype=np.float64
+        )
+        if values.size:
+            summary[f'{metric}_stats'] = {
+                'min': float(values.min()),
+                'max': float(values.max()),
+                'avg': round(float(values.mean()), 2)
+            }
     
     return summary